@@ -1,13 +1,38 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from typing import Iterable
 
 from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import bindparam, insert
+from sqlalchemy.dialects import sqlite
 from sqlmodel import Session, select
 
 from example_app_fastapi.database import get_session, init_db
 from example_app_fastapi.models import Customer
 
+_CUSTOMER_TABLE = Customer.__table__
+# Compiled once; rows are encrypted up front and handed to the driver's executemany.
+_INSERT_CUSTOMER = str(
+    insert(_CUSTOMER_TABLE)
+    .values(email=bindparam("email"), email_lookup=bindparam("email_lookup"))
+    .compile(dialect=sqlite.dialect())
+)
+
+
+_EMAIL_TYPE = _CUSTOMER_TABLE.c.email.type
+_EMAIL_LOOKUP_TYPE = _CUSTOMER_TABLE.c.email_lookup.type
+
+
+def bulk_write(session: Session, customers: Iterable[Customer]) -> int:
+    customers = list(customers)
+    emails = _EMAIL_TYPE.encrypt_many([customer.email for customer in customers])
+    lookups = _EMAIL_LOOKUP_TYPE.encrypt_many([customer.email_lookup for customer in customers])
+    rows = list(zip(emails, lookups))
+    session.connection().exec_driver_sql(_INSERT_CUSTOMER, rows)
+    return len(rows)
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     init_db()
@@ -25,6 +50,13 @@ def create_customer(customer: Customer, session: Session = Depends(get_session))
     return customer
 
 
+@app.post("/customers/bulk")
+def create_customers(customers: list[Customer], session: Session = Depends(get_session)) -> dict[str, int]:
+    created = bulk_write(session, customers)
+    session.commit()
+    return {"created": created}
+
+
 @app.get("/customers/{customer_id}", response_model=Customer)
 def get_customer(customer_id: int, session: Session = Depends(get_session)) -> Customer:
     customer = session.get(Customer, customer_id)
@@ -35,8 +67,19 @@ def get_customer(customer_id: int, session: Session = Depends(get_session)) -> C
 
 @app.get("/customers/by-email/{email}", response_model=Customer)
 def get_customer_by_email(email: str, session: Session = Depends(get_session)) -> Customer:
+    # The column type encrypts the email; its deterministic bind cache already makes repeated
+    # lookups cheap and is invalidated by `registry.set_config`, so no app-level cache is needed.
     statement = select(Customer).where(Customer.email_lookup == email)
     customer = session.exec(statement).first()
     if customer is None:
         raise HTTPException(status_code=404, detail="Customer not found")
     return customer
+
+
+if __name__ == "__main__":
+    import os
+
+    import uvicorn
+
+    # uvloop and httptools come with `uvicorn[standard]`; they leave more CPU for encryption.
+    uvicorn.run("example_app_fastapi.main:app", loop="uvloop", http="httptools", workers=os.cpu_count())
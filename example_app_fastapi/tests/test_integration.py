@@ -53,3 +53,28 @@ def test_customer_create_and_lookup(tmp_path: Path) -> None:
         assert customer is not None
 
     app.dependency_overrides.clear()
+
+
+def test_customer_bulk_create(tmp_path: Path) -> None:
+    engine = _test_engine(tmp_path)
+    SQLModel.metadata.create_all(engine)
+
+    def _session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    client = TestClient(app)
+
+    emails = ["bob@example.com", "carol@example.com"]
+    payload = [{"email": email, "email_lookup": email} for email in emails]
+    response = client.post("/customers/bulk", json=payload)
+    assert response.status_code == 200
+    assert response.json() == {"created": 2}
+
+    for email in emails:
+        response = client.get(f"/customers/by-email/{email}")
+        assert response.status_code == 200
+        assert response.json()["email"] == email
+
+    app.dependency_overrides.clear()
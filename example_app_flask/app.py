@@ -24,6 +24,15 @@ def create_app() -> Flask:
             session.refresh(customer)
             return jsonify(customer.model_dump())
 
+    @app.post("/customers/bulk")
+    def create_customers():
+        payload = request.get_json(force=True)
+        customers = [Customer(**item) for item in payload]
+        with get_session() as session:
+            session.bulk_insert_mappings(Customer, [customer.model_dump(exclude={"id"}) for customer in customers])
+            session.commit()
+        return jsonify({"created": len(customers)})
+
     @app.get("/customers/<int:customer_id>")
     def get_customer(customer_id: int):
         with get_session() as session:
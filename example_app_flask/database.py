@@ -1,13 +1,44 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, event
 from sqlmodel import Session, SQLModel, create_engine
 
-engine = create_engine("sqlite:///./example_app_flask.db", echo=False)
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    # Applied to every pooled connection: WAL lets readers run alongside the writer,
+    # NORMAL sync is safe under WAL, and mmap/cache keep hot pages out of read syscalls.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    engine = create_engine(
+        "sqlite:///./example_app_flask.db",
+        echo=False,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=5,
+        max_overflow=10,
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
 
 
 def init_db() -> None:
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
 
 
-def get_session() -> Session:
-    return Session(engine)
+@contextmanager
+def get_session() -> Iterator[Session]:
+    with Session(get_engine()) as session:
+        yield session
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+import inspect
+import io
 import json
-from pathlib import Path
-from typing import Any, Callable, Optional
+import os
+import struct
+import threading
+from typing import Any, Callable, Iterable, Mapping, Optional
 
 from sqlalchemy.types import LargeBinary, TypeDecorator
-from tink import JsonKeysetReader, aead, cleartext_keyset_handle, read_keyset_handle
+from tink import (
+    BinaryKeysetWriter,
+    JsonKeysetReader,
+    aead,
+    cleartext_keyset_handle,
+    read_keyset_handle,
+)
+from tink.proto import aes_gcm_pb2, tink_pb2
 
 try:
     from tink import daead
@@ -18,6 +30,16 @@ except ImportError:  # pragma: no cover - depends on Tink build
     DAEAD_AVAILABLE = False
     daead = None
 
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    AESGCM_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    AESGCM_AVAILABLE = False
+    AESGCM = None
+    InvalidTag = None
+
 
 def _register_tink_primitives() -> None:
     aead.register()
@@ -29,13 +51,19 @@ _register_tink_primitives()
 
 DEFAULT_KEYSET = "default"
 
+_AES_GCM_TYPE_URL = "type.googleapis.com/google.crypto.tink.AesGcmKey"
+_AES_GCM_NONCE_SIZE = 12
+
 
 class ConfigurationError(RuntimeError):
     """Raised when keyset configuration is missing or invalid."""
 
 
+EMPTY_AAD = b""
+
+
 def _default_aad_callback(*_args: Any, **_kwargs: Any) -> bytes:
-    return b""
+    return EMPTY_AAD
 
 
 DEFAULT_AAD_CALLBACK = _default_aad_callback
@@ -51,19 +79,180 @@ def _ensure_bytes(value: Any) -> bytes:
     raise TypeError("AAD callback must return bytes or str.")
 
 
-def _json_serialize(value: Any) -> str:
-    return json.dumps(value, separators=(",", ":"), sort_keys=True)
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _aad_invoker(aad_callback: Callable[..., Any]) -> Callable[[Any, Any, bool], bytes]:
+    """Pick the AAD callback call shape once instead of probing it on every row."""
+    if aad_callback is DEFAULT_AAD_CALLBACK:
+        return lambda _value, _dialect, _is_bind: EMPTY_AAD
+    try:
+        parameters = inspect.signature(aad_callback).parameters.values()
+    except (TypeError, ValueError):  # no introspectable signature; assume the full form
+        takes_context = True
+    else:
+        takes_context = (
+            any(parameter.kind is inspect.Parameter.VAR_POSITIONAL for parameter in parameters)
+            or sum(parameter.kind in _POSITIONAL_KINDS for parameter in parameters) >= 3
+        )
+    if takes_context:
+        return lambda value, dialect, is_bind: _ensure_bytes(aad_callback(value, dialect, is_bind))
+    return lambda _value, _dialect, _is_bind: _ensure_bytes(aad_callback())
+
+
+# json.dumps builds a new JSONEncoder on every call when given options; this one is
+# stateless between calls and produces identical output.
+_STABLE_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
 
 
-def _json_deserialize(value: str) -> Any:
+def _json_serialize(value: Any) -> bytes:
+    # Escaped output is pure ASCII, so this encode never fails (lone surrogates included).
+    return _STABLE_JSON_ENCODER.encode(value).encode("ascii")
+
+
+def _json_deserialize(value: Any) -> Any:
     return json.loads(value)
 
 
+def _to_bytes(value: Any) -> bytes:
+    """Convert a buffer (memoryview, bytearray) to the `bytes` Tink requires."""
+    if type(value) is memoryview:  # memoryview cannot be subclassed
+        return value.tobytes()
+    return bytes(value)
+
+
+def _byte_view(value: Any) -> Any:
+    """Zero-copy unsigned-byte view of a buffer; only non-contiguous buffers are copied."""
+    view = value if type(value) is memoryview else memoryview(value)
+    if not view.c_contiguous:
+        return view.tobytes()
+    return view if view.format == "B" else view.cast("B")
+
+
+class _AesGcmFastPath:
+    """AES-GCM primitive backed by `cryptography` that reads and writes Tink's wire format.
+
+    Ciphertexts are `prefix || nonce || ciphertext || tag`, exactly what Tink produces for
+    the primary key, so data written by either backend can be read by the other. Anything
+    not addressed to the primary key is handed to the Tink primitive.
+    """
+
+    def __init__(self, key_value: bytes, prefix: bytes, fallback: aead.Aead) -> None:
+        self._aesgcm = AESGCM(key_value)
+        self._prefix = prefix
+        self._nonce_end = len(prefix) + _AES_GCM_NONCE_SIZE
+        self._fallback = fallback
+
+    def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+        nonce = os.urandom(_AES_GCM_NONCE_SIZE)
+        # One join builds the frame with a single copy of the body and no intermediate objects.
+        return b"".join((self._prefix, nonce, self._aesgcm.encrypt(nonce, plaintext, associated_data)))
+
+    def decrypt(self, ciphertext: Any, associated_data: bytes) -> bytes:
+        # Slice through a byte view so the nonce and body reach OpenSSL without copies.
+        view = _byte_view(ciphertext)
+        if view[: len(self._prefix)] != self._prefix or len(view) < self._nonce_end:
+            return self._fallback.decrypt(_to_bytes(view), associated_data)
+        nonce = view[len(self._prefix) : self._nonce_end]
+        try:
+            return self._aesgcm.decrypt(nonce, view[self._nonce_end :], associated_data)
+        except InvalidTag:
+            # Non-primary keys may share the prefix (RAW keys always do); let Tink try them.
+            return self._fallback.decrypt(_to_bytes(view), associated_data)
+
+
+def _aes_gcm_fast_path(keyset_handle: Any, fallback: aead.Aead) -> Optional[_AesGcmFastPath]:
+    """Build an AES-GCM fast path for the primary key, or return None if it is not eligible."""
+    if not AESGCM_AVAILABLE:
+        return None
+    stream = io.BytesIO()
+    cleartext_keyset_handle.write(BinaryKeysetWriter(stream), keyset_handle)
+    keyset = tink_pb2.Keyset.FromString(stream.getvalue())
+    primary = next((key for key in keyset.key if key.key_id == keyset.primary_key_id), None)
+    if primary is None or primary.key_data.type_url != _AES_GCM_TYPE_URL:
+        return None
+    if primary.output_prefix_type == tink_pb2.TINK:
+        prefix = b"\x01" + struct.pack(">I", primary.key_id)
+    elif primary.output_prefix_type == tink_pb2.RAW:
+        prefix = b""
+    else:
+        return None
+    key = aes_gcm_pb2.AesGcmKey.FromString(primary.key_data.value)
+    return _AesGcmFastPath(key.key_value, prefix, fallback)
+
+
+# Cached in place of None for keysets without an eligible primary key.
+_NOT_ELIGIBLE = object()
+
+
+class _LRUCache:
+    """Bounded, thread-safe LRU mapping."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copies start empty: the lock cannot be pickled and cached entries are process-local.
+        return (type(self), (self.maxsize,))
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _CachedDecryption:
+    """Primitive wrapper that remembers plaintexts for recently decrypted ciphertexts."""
+
+    def __init__(self, primitive: Any, cache: _LRUCache) -> None:
+        self._primitive = primitive
+        self._cache = cache
+
+    def _lookup(self, decrypt: Callable[[bytes, bytes], bytes], ciphertext: Any, associated_data: bytes) -> bytes:
+        cache_key = (ciphertext if type(ciphertext) is bytes else _to_bytes(ciphertext), associated_data)
+        plaintext = self._cache.get(cache_key)
+        if plaintext is None:
+            plaintext = decrypt(ciphertext, associated_data)
+            self._cache.set(cache_key, plaintext)
+        return plaintext
+
+    def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+        return self._primitive.encrypt(plaintext, associated_data)
+
+    def decrypt(self, ciphertext: Any, associated_data: bytes) -> bytes:
+        return self._lookup(self._primitive.decrypt, ciphertext, associated_data)
+
+    def encrypt_deterministically(self, plaintext: bytes, associated_data: bytes) -> bytes:
+        return self._primitive.encrypt_deterministically(plaintext, associated_data)
+
+    def decrypt_deterministically(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+        return self._lookup(self._primitive.decrypt_deterministically, ciphertext, associated_data)
+
+
 @dataclass(frozen=True)
 class KeysetConfig:
     path: str
     master_key_aead: Optional[aead.Aead] = None
     cleartext: bool = False
+    decrypt_cache: int = 0
 
     def __post_init__(self) -> None:
         self.validate()
@@ -71,28 +260,119 @@ class KeysetConfig:
     def validate(self) -> None:
         if not self.path:
             raise ConfigurationError("Keyset path cannot be empty.")
-        if not Path(self.path).exists():
-            raise ConfigurationError(f"Keyset {self.path} does not exist.")
         if not self.cleartext and self.master_key_aead is None:
             raise ConfigurationError("Encrypted keysets must specify `master_key_aead`.")
+        if self.decrypt_cache < 0:
+            raise ConfigurationError("`decrypt_cache` must be zero (disabled) or a positive size.")
+
+
+def _read_keyset_handle(options: Mapping[str, Any]) -> Any:
+    keyset_config = KeysetConfig(**options)
+    try:
+        with open(keyset_config.path, "r", encoding="utf-8") as handle:
+            reader = JsonKeysetReader(handle.read())
+    except FileNotFoundError as exc:
+        raise ConfigurationError(f"Keyset {keyset_config.path} does not exist.") from exc
+    if keyset_config.cleartext:
+        return cleartext_keyset_handle.read(reader)
+    return read_keyset_handle(reader, keyset_config.master_key_aead)
+
+
+def _snapshot_config(config: Mapping[str, Mapping[str, Any]]) -> dict[str, dict[str, Any]]:
+    # Plain dict copies (not read-only proxies) so registries and fields stay picklable.
+    return {name: dict(options) for name, options in config.items()}
 
 
 class KeysetRegistry:
     """Registry that owns keyset configuration and keyset handle cache."""
 
-    def __init__(self, config: dict[str, dict[str, Any]]) -> None:
-        self._config = config
-        self._handle_cache: dict[tuple[str, str, bool, int], Any] = {}
+    def __init__(self, config: Mapping[str, Mapping[str, Any]]) -> None:
+        self._config = _snapshot_config(config)
+        self._generation = 0
+        self._decrypt_caches: dict[str, _LRUCache] = {}
+        self._init_keyset_caches()
+
+    def _init_keyset_caches(self) -> None:
+        # Scoped to the registry: a new registry always reads the keyset files currently on disk.
+        # Reads are plain dict lookups; the lock only serializes writes, so concurrent first
+        # uses load a keyset once.
+        self._handle_cache: dict[frozenset[tuple[str, Any]], Any] = {}
+        self._primitive_cache: dict[tuple[Any, frozenset[tuple[str, Any]]], Any] = {}
+        self._cache_lock = threading.RLock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Keyset handles, primitives and the lock cannot be pickled; copies reload on first use.
+        state = self.__dict__.copy()
+        for name in ("_handle_cache", "_primitive_cache", "_cache_lock"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_keyset_caches()
 
     @property
-    def config(self) -> dict[str, dict[str, Any]]:
+    def config(self) -> Mapping[str, Mapping[str, Any]]:
         return self._config
 
-    def set_config(self, config: dict[str, dict[str, Any]]) -> None:
-        self._config = config
-        self._handle_cache.clear()
+    def set_config(self, config: Mapping[str, Mapping[str, Any]]) -> None:
+        # Readers only ever see a complete snapshot: publishing it is one assignment. The generation
+        # bump comes last, so anything resolved under the new generation used the new config.
+        self._config = _snapshot_config(config)
+        self._decrypt_caches = {}
+        self._handle_cache = {}
+        self._primitive_cache = {}
+        self._generation += 1
+
+    def _get_or_create(self, cache: dict[Any, Any], key: Any, factory: Callable[[], Any]) -> Any:
+        value = cache.get(key)
+        if value is None:
+            with self._cache_lock:
+                value = cache.get(key)
+                if value is None:
+                    value = cache[key] = factory()
+        return value
+
+    def _load_keyset_handle(self, options: Mapping[str, Any]) -> Any:
+        """Validate a keyset configuration and read its handle, once per unique configuration.
+
+        Keyed on the raw options (path, cleartext flag and the master key object itself),
+        so fields sharing a keyset skip the dataclass, filesystem check and JSON parse.
+        """
+        return self._get_or_create(
+            self._handle_cache, frozenset(options.items()), lambda: _read_keyset_handle(options)
+        )
+
+    def _load_primitive(self, primitive_class: Any, options: Mapping[str, Any]) -> Any:
+        return self._get_or_create(
+            self._primitive_cache,
+            (primitive_class, frozenset(options.items())),
+            lambda: self._load_keyset_handle(options).primitive(primitive_class),
+        )
+
+    def _load_fast_aead(self, options: Mapping[str, Any]) -> Optional[_AesGcmFastPath]:
+        # Shared like the Tink primitives, so every fast-path field on a keyset reuses one AES-GCM
+        # object. Ineligible keysets are cached as _NOT_ELIGIBLE, since a stored None reads as a
+        # miss and would re-export the keyset for every new manager.
+        fast_aead = self._get_or_create(
+            self._primitive_cache,
+            (_AesGcmFastPath, frozenset(options.items())),
+            lambda: _aes_gcm_fast_path(
+                self._load_keyset_handle(options), self._load_primitive(aead.Aead, options)
+            )
+            or _NOT_ELIGIBLE,
+        )
+        return None if fast_aead is _NOT_ELIGIBLE else fast_aead
+
+    def _decrypt_cache(self, keyset_name: str) -> Optional[_LRUCache]:
+        maxsize = self._config.get(keyset_name, {}).get("decrypt_cache", 0)
+        if not maxsize:
+            return None
+        return self._decrypt_caches.setdefault(keyset_name, _LRUCache(maxsize))
 
-    def keyset_manager(self, keyset_name: str, aad_callback: Callable[..., Any]) -> "KeysetManager":
+    def keyset_manager(
+        self, keyset_name: str, aad_callback: Callable[..., Any] = DEFAULT_AAD_CALLBACK
+    ) -> "KeysetManager":
         return KeysetManager(self, keyset_name, aad_callback)
 
     def encrypted_type(self, **kwargs: Any) -> "EncryptedType":
@@ -121,57 +401,76 @@ class KeysetRegistry:
 
 
 class KeysetManager:
-    def __init__(self, registry: KeysetRegistry, keyset_name: str, aad_callback: Callable[..., Any]) -> None:
+    def __init__(
+        self,
+        registry: KeysetRegistry,
+        keyset_name: str,
+        aad_callback: Callable[..., Any] = DEFAULT_AAD_CALLBACK,
+    ) -> None:
         self._registry = registry
         self.keyset_name = keyset_name
         self.aad_callback = aad_callback
-        self._keyset_handle = None
-
-    def _get_config(self) -> dict[str, dict[str, Any]]:
+        self._primitives: dict[Any, Any] = {}
+        self._primitives_generation = -1
+        self._fast_aead_handle = None
+        self._fast_aead: Optional[_AesGcmFastPath] = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Tink primitives cannot be pickled; copies reload them on first use.
+        state = self.__dict__.copy()
+        state.update(_primitives={}, _primitives_generation=-1, _fast_aead_handle=None, _fast_aead=None)
+        return state
+
+    def _get_config(self) -> Mapping[str, Mapping[str, Any]]:
         if not self._registry.config:
             raise ConfigurationError("Keysets are not configured. Provide a KeysetRegistry with config.")
         return self._registry.config
 
-    def _get_keyset_handle(self) -> Any:
-        if self._keyset_handle is not None:
-            return self._keyset_handle
-
+    def _get_keyset_options(self) -> Mapping[str, Any]:
         config = self._get_config()
         if self.keyset_name not in config:
             raise ConfigurationError(f"Missing keyset configuration for '{self.keyset_name}'.")
+        return config[self.keyset_name]
 
-        keyset_config = KeysetConfig(**config[self.keyset_name])
-        cache_key = (
-            self.keyset_name,
-            keyset_config.path,
-            keyset_config.cleartext,
-            id(keyset_config.master_key_aead) if keyset_config.master_key_aead is not None else 0,
-        )
-        cached_handle = self._registry._handle_cache.get(cache_key)
-        if cached_handle is not None:
-            self._keyset_handle = cached_handle
-            return cached_handle
-
-        with open(keyset_config.path, "r", encoding="utf-8") as handle:
-            reader = JsonKeysetReader(handle.read())
-            if keyset_config.cleartext:
-                keyset_handle = cleartext_keyset_handle.read(reader)
-            else:
-                keyset_handle = read_keyset_handle(reader, keyset_config.master_key_aead)
-
-        self._registry._handle_cache[cache_key] = keyset_handle
-        self._keyset_handle = keyset_handle
-        return keyset_handle
+    def _get_keyset_handle(self) -> Any:
+        return self._registry._load_keyset_handle(self._get_keyset_options())
+
+    def _get_primitive(self, primitive_class: Any) -> Any:
+        # Memoized per registry generation so repeated property access skips the config
+        # lookup and the process-wide cache key construction.
+        generation = self._registry._generation
+        if self._primitives_generation != generation:
+            self._primitives = {}
+            self._primitives_generation = generation
+        primitive = self._primitives.get(primitive_class)
+        if primitive is None:
+            primitive = self._registry._load_primitive(primitive_class, self._get_keyset_options())
+            self._primitives[primitive_class] = primitive
+        return primitive
+
+    def with_decrypt_cache(self, primitive: Any) -> Any:
+        """Wrap `primitive` with the keyset's decrypt cache when `decrypt_cache` is configured."""
+        cache = self._registry._decrypt_cache(self.keyset_name)
+        return primitive if cache is None else _CachedDecryption(primitive, cache)
 
     @property
     def aead_primitive(self) -> aead.Aead:
-        return self._get_keyset_handle().primitive(aead.Aead)
+        return self._get_primitive(aead.Aead)
+
+    @property
+    def fast_aead_primitive(self) -> Optional[_AesGcmFastPath]:
+        """AES-GCM primitive on `cryptography`, or None when the primary key is not eligible."""
+        keyset_handle = self._get_keyset_handle()
+        if self._fast_aead_handle is not keyset_handle:
+            self._fast_aead = self._registry._load_fast_aead(self._get_keyset_options())
+            self._fast_aead_handle = keyset_handle
+        return self._fast_aead
 
     @property
     def daead_primitive(self) -> Any:
         if not DAEAD_AVAILABLE:
             raise ConfigurationError("Deterministic AEAD is not available in this Tink build.")
-        return self._get_keyset_handle().primitive(daead.DeterministicAead)
+        return self._get_primitive(daead.DeterministicAead)
 
 
 class EncryptedType(TypeDecorator):
@@ -188,6 +487,8 @@ class EncryptedType(TypeDecorator):
         aad_callback: Callable[..., Any] = DEFAULT_AAD_CALLBACK,
         serializer: Callable[[Any], Any] = _json_serialize,
         deserializer: Callable[[Any], Any] = _json_deserialize,
+        fast_path: bool = False,
+        aad_cache: bool = False,
     ) -> None:
         super().__init__()
         if registry is None:
@@ -197,14 +498,65 @@ class EncryptedType(TypeDecorator):
         self.aad_callback = aad_callback
         self.serializer = serializer
         self.deserializer = deserializer
+        self.fast_path = fast_path
+        self.aad_cache = aad_cache
         self._keyset_manager = self.registry.keyset_manager(self.keyset, self.aad_callback)
-
-    def _call_aad(self, value: Any, dialect: Any, is_bind: bool) -> bytes:
-        try:
-            aad_value = self.aad_callback(value, dialect, is_bind)
-        except TypeError:
-            aad_value = self.aad_callback()
-        return _ensure_bytes(aad_value)
+        self._aad_is_empty = aad_callback is DEFAULT_AAD_CALLBACK
+        self._aad_invoker = self._build_aad_invoker()
+        self._aead_primitive: Optional[aead.Aead] = None
+        self._aead_generation = -1
+        self._aead_accepts_buffers = False
+        if self.keyset in registry.config:
+            # Load the keyset while the model is being declared rather than on the first row.
+            # Any failure (bad options, unreadable path, Tink errors) is left for first use,
+            # which raises it with the usual context instead of failing the model import.
+            try:
+                self._resolve_primitive()
+            except Exception:
+                pass
+
+    # Runtime state dropped from pickles and deep copies and rebuilt on first use: Tink
+    # primitives and the AAD invoker lambda cannot be pickled.
+    _TRANSIENT_STATE: Mapping[str, Any] = {
+        "_aad_invoker": None,
+        "_aead_primitive": None,
+        "_aead_generation": -1,
+        "_aead_accepts_buffers": False,
+    }
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.update(self._TRANSIENT_STATE)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._aad_invoker = self._build_aad_invoker()
+
+    def _build_aad_invoker(self) -> Callable[[Any, Any, bool], bytes]:
+        invoker = _aad_invoker(self.aad_callback)
+        if self.aad_cache and not self._aad_is_empty:
+            # The caller vouches that the callback is constant: evaluate it once, without row context.
+            constant_aad = invoker(None, None, True)
+            return lambda _value, _dialect, _is_bind: constant_aad
+        return invoker
+
+    def _get_aead(self) -> aead.Aead:
+        # Resolve the primitive once per registry generation instead of walking
+        # the keyset manager on every row. The generation is read before resolving, so a
+        # concurrent set_config leaves a stale primitive tagged stale rather than current.
+        generation = self.registry._generation
+        if self._aead_primitive is None or self._aead_generation != generation:
+            primitive = self._keyset_manager.fast_aead_primitive if self.fast_path else None
+            self._aead_primitive = self._keyset_manager.with_decrypt_cache(
+                primitive or self._keyset_manager.aead_primitive
+            )
+            self._aead_generation = generation
+            self._aead_accepts_buffers = primitive is not None
+        return self._aead_primitive
+
+    def _resolve_primitive(self) -> Any:
+        return self._get_aead()
 
     def _serialize(self, value: Any) -> bytes:
         serialized = self.serializer(value)
@@ -220,19 +572,42 @@ class EncryptedType(TypeDecorator):
         except Exception:
             return self.deserializer(value.decode("utf-8"))
 
+    def encrypt_many(self, values: Iterable[Any], dialect: Any = None) -> list[Any]:
+        """Encrypt a batch as `process_bind_param` would, resolving the primitive once."""
+        if not self._aad_is_empty:
+            bind = self.process_bind_param
+            return [bind(value, dialect) for value in values]
+        encrypt = self._get_aead().encrypt
+        serialize = self._serialize
+        return [None if value is None else encrypt(serialize(value), EMPTY_AAD) for value in values]
+
+    def decrypt_many(self, values: Iterable[Any], dialect: Any = None) -> list[Any]:
+        """Decrypt a batch as `process_result_value` would, resolving the primitive once."""
+        if not self._aad_is_empty:
+            result = self.process_result_value
+            return [result(value, dialect) for value in values]
+        decrypt = self._get_aead().decrypt
+        deserialize = self._deserialize
+        as_input = (lambda value: value) if self._aead_accepts_buffers else _to_bytes
+        return [
+            None if value is None else deserialize(decrypt(as_input(value), EMPTY_AAD))
+            for value in values
+        ]
+
     def process_bind_param(self, value: Any, dialect: Any) -> Any:
         if value is None:
             return None
-        aad = self._call_aad(value, dialect, True)
+        aad = EMPTY_AAD if self._aad_is_empty else self._aad_invoker(value, dialect, True)
         serialized = self._serialize(value)
-        return self._keyset_manager.aead_primitive.encrypt(serialized, aad)
+        return self._get_aead().encrypt(serialized, aad)
 
     def process_result_value(self, value: Any, dialect: Any) -> Any:
         if value is None:
             return None
-        aad = self._call_aad(None, dialect, False)
-        data = value.tobytes() if isinstance(value, memoryview) else bytes(value)
-        decrypted = self._keyset_manager.aead_primitive.decrypt(data, aad)
+        aad = EMPTY_AAD if self._aad_is_empty else self._aad_invoker(None, dialect, False)
+        aead_primitive = self._get_aead()
+        data = value if type(value) is bytes or self._aead_accepts_buffers else _to_bytes(value)
+        decrypted = aead_primitive.decrypt(data, aad)
         return self._deserialize(decrypted)
 
 
@@ -240,24 +615,95 @@ class DeterministicEncryptedType(EncryptedType):
     """Encrypts values using deterministic AEAD for equality lookups."""
     cache_ok = True
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *,
+        precompute_values: Optional[Iterable[Any]] = None,
+        bind_cache_size: int = 1024,
+        **kwargs: Any,
+    ) -> None:
         if not DAEAD_AVAILABLE:
             raise ConfigurationError("Deterministic AEAD is not available in this Tink build.")
+        if bind_cache_size < 0:
+            raise ConfigurationError("`bind_cache_size` must be zero (disabled) or a positive size.")
+        # Set before EncryptedType.__init__, which may resolve the primitive eagerly.
+        self._daead_primitive: Any = None
+        self._daead_generation = -1
+        self.precompute_values = tuple(precompute_values) if precompute_values is not None else None
+        self._precomputed: dict[bytes, bytes] = {}
+        self._precomputed_generation = -1
+        # Deterministic AEAD maps a (key, plaintext, aad) triple to one ciphertext, so repeated
+        # binds of the same value can skip the cipher. Never used for randomized AEAD.
+        self.bind_cache_size = bind_cache_size
+        self._bind_cache = _LRUCache(bind_cache_size) if bind_cache_size else None
         super().__init__(**kwargs)
+        if precompute_values is not None and not self._aad_is_empty:
+            raise ConfigurationError("`precompute_values` requires the default AAD callback.")
+
+    _TRANSIENT_STATE: Mapping[str, Any] = {
+        **EncryptedType._TRANSIENT_STATE,
+        "_daead_primitive": None,
+        "_daead_generation": -1,
+        "_precomputed_generation": -1,
+    }
+
+    def _get_daead(self) -> Any:
+        generation = self.registry._generation
+        if self._daead_primitive is None or self._daead_generation != generation:
+            self._daead_primitive = self._keyset_manager.with_decrypt_cache(self._keyset_manager.daead_primitive)
+            self._daead_generation = generation
+        return self._daead_primitive
+
+    def _resolve_primitive(self) -> Any:
+        return self._get_daead()
+
+    def encrypt_many(self, values: Iterable[Any], dialect: Any = None) -> list[Any]:
+        # Route through the hook so precomputed values and the bind cache still apply.
+        bind = self.process_bind_param
+        return [bind(value, dialect) for value in values]
+
+    def decrypt_many(self, values: Iterable[Any], dialect: Any = None) -> list[Any]:
+        result = self.process_result_value
+        return [result(value, dialect) for value in values]
+
+    def _get_precomputed(self) -> dict[bytes, bytes]:
+        # Ciphertexts for a known, finite column domain, encrypted once per keyset generation.
+        generation = self.registry._generation
+        if self._precomputed_generation != generation:
+            primitive = self._get_daead()
+            serialized_values = (self._serialize(value) for value in self.precompute_values)
+            self._precomputed = {
+                serialized: primitive.encrypt_deterministically(serialized, EMPTY_AAD)
+                for serialized in serialized_values
+            }
+            self._precomputed_generation = generation
+        return self._precomputed
 
     def process_bind_param(self, value: Any, dialect: Any) -> Any:
         if value is None:
             return None
-        aad = self._call_aad(value, dialect, True)
+        aad = EMPTY_AAD if self._aad_is_empty else self._aad_invoker(value, dialect, True)
         serialized = self._serialize(value)
-        return self._keyset_manager.daead_primitive.encrypt_deterministically(serialized, aad)
+        if self.precompute_values is not None:
+            ciphertext = self._get_precomputed().get(serialized)
+            if ciphertext is not None:
+                return ciphertext
+        bind_cache = self._bind_cache
+        if bind_cache is None:
+            return self._get_daead().encrypt_deterministically(serialized, aad)
+        cache_key = (self.registry._generation, serialized, aad)
+        ciphertext = bind_cache.get(cache_key)
+        if ciphertext is None:
+            ciphertext = self._get_daead().encrypt_deterministically(serialized, aad)
+            bind_cache.set(cache_key, ciphertext)
+        return ciphertext
 
     def process_result_value(self, value: Any, dialect: Any) -> Any:
         if value is None:
             return None
-        aad = self._call_aad(None, dialect, False)
-        data = value.tobytes() if isinstance(value, memoryview) else bytes(value)
-        decrypted = self._keyset_manager.daead_primitive.decrypt_deterministically(data, aad)
+        aad = EMPTY_AAD if self._aad_is_empty else self._aad_invoker(None, dialect, False)
+        data = value if type(value) is bytes else _to_bytes(value)
+        decrypted = self._get_daead().decrypt_deterministically(data, aad)
         return self._deserialize(decrypted)
 
 
@@ -275,10 +721,20 @@ def _deserialize_text(value: str) -> str:
     raise TypeError("Value must be str or bytes.")
 
 
-def _serialize_bytes(value: bytes) -> bytes:
-    if not isinstance(value, bytes):
-        raise TypeError("Value must be bytes.")
-    return value
+def _serialize_bytes(value: Any) -> bytes:
+    # Exact-type checks are pointer compares; isinstance only runs for subclasses and errors.
+    value_type = type(value)
+    if value_type is bytes:
+        return value
+    if value_type is bytearray:
+        return bytes(value)
+    if value_type is memoryview:
+        return value.tobytes()
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, bytearray):
+        return bytes(value)
+    raise TypeError("Value must be bytes-like.")
 
 
 def _deserialize_bytes(value: bytes) -> bytes:
@@ -289,15 +745,47 @@ class EncryptedString(EncryptedType):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(serializer=_serialize_text, deserializer=_deserialize_text, **kwargs)
 
+    # The codec is fixed, so call the C-level str/bytes methods directly instead of going
+    # through the generic wrappers. str.encode rejects non-str values with TypeError.
+    _serialize = staticmethod(str.encode)
+    _deserialize = staticmethod(bytes.decode)
+
 
 class EncryptedJSON(EncryptedType):
-    pass
+    def __init__(self, **kwargs: Any) -> None:
+        # The default codec already yields bytes and parses bytes, so bind it directly and
+        # skip the generic type checks in `_serialize`/`_deserialize`.
+        if kwargs.get("serializer", _json_serialize) is _json_serialize:
+            self._serialize = _json_serialize
+        if kwargs.get("deserializer", _json_deserialize) is _json_deserialize:
+            self._deserialize = _json_deserialize
+        super().__init__(**kwargs)
 
 
 class EncryptedBytes(EncryptedType):
+    """Encrypts bytes-like values (bytes, bytearray, memoryview); results come back as bytes."""
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(serializer=_serialize_bytes, deserializer=_deserialize_bytes, **kwargs)
 
+    _serialize = staticmethod(_serialize_bytes)
+    _deserialize = staticmethod(_deserialize_bytes)
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        aad = EMPTY_AAD if self._aad_is_empty else self._aad_invoker(value, dialect, True)
+        aead_primitive = self._get_aead()
+        # The fast path reads a bytearray in place; any other buffer (strided, non-byte
+        # formats) is normalized exactly as it is for Tink, so valid inputs don't depend on
+        # the backend.
+        value_type = type(value)
+        if value_type is bytes or (value_type is bytearray and self._aead_accepts_buffers):
+            data = value
+        else:
+            data = _serialize_bytes(value)
+        return aead_primitive.encrypt(data, aad)
+
 
 class DeterministicEncryptedString(DeterministicEncryptedType):
     cache_ok = True
@@ -305,6 +793,9 @@ class DeterministicEncryptedString(DeterministicEncryptedType):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(serializer=_serialize_text, deserializer=_deserialize_text, **kwargs)
 
+    _serialize = staticmethod(str.encode)
+    _deserialize = staticmethod(bytes.decode)
+
 
 class DeterministicEncryptedJSON(DeterministicEncryptedType):
     cache_ok = True
@@ -316,3 +807,6 @@ class DeterministicEncryptedBytes(DeterministicEncryptedType):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(serializer=_serialize_bytes, deserializer=_deserialize_bytes, **kwargs)
+
+    # _serialize_bytes already returns bytes, so skip the generic _serialize checks.
+    _serialize = staticmethod(_serialize_bytes)
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import copy
+import math
+import pickle
+import shutil
+import uuid
+from array import array
 from pathlib import Path
 from typing import Any
 
 import pytest
+import tink
+from tink import TinkError, aead, cleartext_keyset_handle
 
 try:
     from tink import daead
@@ -13,6 +21,15 @@ except ImportError:  # pragma: no cover - depends on Tink build
     DAEAD_AVAILABLE = False
     daead = None
 
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    AESGCM_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    AESGCM_AVAILABLE = False
+    AESGCM = None
+
+from sqlmodel_encrypted_fields import fields as fields_module
 from sqlmodel_encrypted_fields import (
     ConfigurationError,
     DeterministicEncryptedBytes,
@@ -25,12 +42,14 @@ from sqlmodel_encrypted_fields import (
     KeysetRegistry,
 )
 
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
 
 @pytest.fixture(scope="module")
 def keysets(tmp_path_factory: pytest.TempPathFactory) -> dict[str, dict[str, Any]]:
     tmp_path = tmp_path_factory.mktemp("keysets")
     aead_path = tmp_path / "aead_keyset.json"
-    aead_path.write_text(_fixture_path("aead_keyset.json").read_text(encoding="utf-8"), encoding="utf-8")
+    shutil.copyfile(_fixture_path("aead_keyset.json"), aead_path)
 
     config = {
         "default": {"path": str(aead_path), "cleartext": True},
@@ -38,14 +57,14 @@ def keysets(tmp_path_factory: pytest.TempPathFactory) -> dict[str, dict[str, Any
 
     if DAEAD_AVAILABLE:
         daead_path = tmp_path / "daead_keyset.json"
-        daead_path.write_text(_fixture_path("daead_keyset.json").read_text(encoding="utf-8"), encoding="utf-8")
+        shutil.copyfile(_fixture_path("daead_keyset.json"), daead_path)
         config["deterministic"] = {"path": str(daead_path), "cleartext": True}
 
     return config
 
 
 def _fixture_path(name: str) -> Path:
-    return Path(__file__).parent / "fixtures" / name
+    return _FIXTURES_DIR / name
 
 
 def test_missing_configuration_raises() -> None:
@@ -94,6 +113,14 @@ def test_encrypt_decrypt_json_roundtrip(keysets: dict[str, dict[str, Any]]) -> N
     ciphertext = field.process_bind_param(payload, None)
     decrypted = field.process_result_value(ciphertext, None)
     assert decrypted == payload
+    for value in ({"ü": "\ud800"}, [2**64 + 1], "snowman \u2603", {"x": float("inf")}, [float("-inf")]):
+        assert field.process_result_value(field.process_bind_param(value, None), None) == value
+    assert math.isnan(field.process_result_value(field.process_bind_param(float("nan"), None), None))
+    with pytest.raises(TypeError):
+        field.process_bind_param({"id": uuid.uuid4()}, None)
+
+    custom = EncryptedJSON(registry=registry, serializer=lambda value: f"<{value}>", deserializer=bytes.decode)
+    assert custom.process_result_value(custom.process_bind_param("x", None), None) == "<x>"
 
 
 def test_encrypt_decrypt_bytes_roundtrip(keysets: dict[str, dict[str, Any]]) -> None:
@@ -103,6 +130,13 @@ def test_encrypt_decrypt_bytes_roundtrip(keysets: dict[str, dict[str, Any]]) ->
     ciphertext = field.process_bind_param(payload, None)
     decrypted = field.process_result_value(ciphertext, None)
     assert decrypted == payload
+    assert field.process_result_value(field.process_bind_param(bytearray(payload), None), None) == payload
+    assert field.process_result_value(field.process_bind_param(memoryview(payload), None), None) == payload
+
+    class Blob(bytes):
+        pass
+
+    assert field.process_result_value(field.process_bind_param(Blob(payload), None), None) == payload
 
 
 def test_custom_serializer_roundtrip(keysets: dict[str, dict[str, Any]]) -> None:
@@ -132,12 +166,47 @@ def test_aad_callback_supports_str(keysets: dict[str, dict[str, Any]]) -> None:
     assert decrypted == "data"
 
 
+def test_none_short_circuits_without_crypto() -> None:
+    # An unconfigured registry raises on any primitive access, so None must never reach one.
+    registry = KeysetRegistry({})
+    field_types: list[type[EncryptedType]] = [EncryptedType, EncryptedString, EncryptedJSON, EncryptedBytes]
+    if DAEAD_AVAILABLE:
+        field_types += [DeterministicEncryptedString, DeterministicEncryptedJSON, DeterministicEncryptedBytes]
+
+    def aad_callback() -> bytes:
+        raise AssertionError("AAD requested for None")
+
+    for field_type in field_types:
+        for kwargs in ({}, {"aad_callback": aad_callback}):
+            field = field_type(registry=registry, **kwargs)
+            assert field.process_bind_param(None, None) is None
+            assert field.process_result_value(None, None) is None
+
+
+def test_aad_cache_evaluates_callback_once(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    calls = []
+
+    def aad_callback() -> str:
+        calls.append(None)
+        return "context"
+
+    field = EncryptedString(aad_callback=aad_callback, aad_cache=True, registry=registry)
+    ciphertexts = [field.process_bind_param("data", None) for _ in range(3)]
+    assert [field.process_result_value(ciphertext, None) for ciphertext in ciphertexts] == ["data"] * 3
+    assert len(calls) == 1
+
+    uncached = EncryptedString(aad_callback=lambda: "context", registry=registry)
+    assert uncached.process_result_value(ciphertexts[0], None) == "data"
+
+
 def test_memoryview_result_roundtrip(keysets: dict[str, dict[str, Any]]) -> None:
     registry = KeysetRegistry(keysets)
     field = EncryptedString(registry=registry)
     ciphertext = field.process_bind_param("value", None)
     decrypted = field.process_result_value(memoryview(ciphertext), None)
     assert decrypted == "value"
+    assert field.process_result_value(bytearray(ciphertext), None) == "value"
 
 
 @pytest.mark.skipif(not DAEAD_AVAILABLE, reason="Deterministic AEAD not available")
@@ -147,6 +216,7 @@ def test_deterministic_ciphertext_is_stable(keysets: dict[str, dict[str, Any]])
     first = field.process_bind_param("email@example.com", None)
     second = field.process_bind_param("email@example.com", None)
     assert first == second
+    assert field.process_result_value(memoryview(first), None) == "email@example.com"
 
 
 @pytest.mark.skipif(not DAEAD_AVAILABLE, reason="Deterministic AEAD not available")
@@ -162,3 +232,306 @@ def test_deterministic_roundtrip_json_and_bytes(keysets: dict[str, dict[str, Any
     bytes_payload = b"blob"
     bytes_cipher = bytes_field.process_bind_param(bytes_payload, None)
     assert bytes_field.process_result_value(bytes_cipher, None) == bytes_payload
+
+
+def test_primitive_cached_until_config_changes(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    field = EncryptedString(registry=registry)
+    ciphertext = field.process_bind_param("cached", None)
+    primitive = field._aead_primitive
+    assert primitive is not None
+    assert field.process_result_value(ciphertext, None) == "cached"
+    assert field._aead_primitive is primitive
+
+    registry.set_config(dict(keysets))
+    assert field.process_result_value(ciphertext, None) == "cached"
+    assert field._aead_primitive is not primitive
+
+
+@pytest.mark.skipif(not AESGCM_AVAILABLE, reason="cryptography not installed")
+def test_fast_path_interoperates_with_tink(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    fast_field = EncryptedString(registry=registry, fast_path=True)
+    tink_field = EncryptedString(registry=registry)
+    assert fast_field._get_aead() is fast_field._keyset_manager.fast_aead_primitive
+
+    fast_cipher = fast_field.process_bind_param("fast", None)
+    tink_cipher = tink_field.process_bind_param("tink", None)
+    assert fast_cipher[:5] == tink_cipher[:5]
+    assert tink_field.process_result_value(fast_cipher, None) == "fast"
+    assert fast_field.process_result_value(tink_cipher, None) == "tink"
+    assert fast_field.process_result_value(memoryview(fast_cipher), None) == "fast"
+    assert fast_field.process_result_value(memoryview(tink_cipher), None) == "tink"
+
+    interleaved = bytearray(2 * len(fast_cipher))
+    interleaved[::2] = fast_cipher
+    assert fast_field.process_result_value(memoryview(interleaved)[::2], None) == "fast"
+
+    fast_bytes = EncryptedBytes(registry=registry, fast_path=True)
+    tink_bytes = EncryptedBytes(registry=registry)
+    words = array("i", [1, 2, 3])
+    for value in (memoryview(b"abcdef")[::2], memoryview(words), bytearray(b"raw")):
+        expected = bytes(value)
+        for writer, reader in ((fast_bytes, tink_bytes), (tink_bytes, fast_bytes)):
+            assert reader.process_result_value(writer.process_bind_param(value, None), None) == expected
+
+
+@pytest.mark.skipif(not DAEAD_AVAILABLE, reason="Deterministic AEAD not available")
+def test_deterministic_json_is_stable_for_non_ascii(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    field = DeterministicEncryptedJSON(keyset="deterministic", registry=registry)
+    payload = {"name": "Zoë", "ratio": 1e16}
+    serialized = field._serialize(payload)
+    assert serialized == b'{"name":"Zo\\u00eb","ratio":1e+16}'
+    assert field.process_result_value(field.process_bind_param(payload, None), None) == payload
+
+
+def test_aad_callback_receives_context(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    calls: list[bool] = []
+
+    def aad_callback(_value: Any, _dialect: Any, is_bind: bool) -> bytes:
+        calls.append(is_bind)
+        return b"tenant-1"
+
+    field = EncryptedString(aad_callback=aad_callback, registry=registry)
+    ciphertext = field.process_bind_param("data", None)
+    assert field.process_result_value(ciphertext, None) == "data"
+    assert calls == [True, False]
+
+    other = EncryptedString(aad_callback=lambda: b"tenant-2", registry=registry)
+    with pytest.raises(TinkError):
+        other.process_result_value(ciphertext, None)
+
+
+def test_string_and_bytes_fields_reject_wrong_types(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    with pytest.raises(TypeError):
+        EncryptedString(registry=registry).process_bind_param(b"raw", None)
+    with pytest.raises(TypeError):
+        EncryptedBytes(registry=registry).process_bind_param("text", None)
+    if DAEAD_AVAILABLE:
+        with pytest.raises(TypeError):
+            DeterministicEncryptedString(keyset="deterministic", registry=registry).process_bind_param(1, None)
+
+
+@pytest.mark.skipif(not DAEAD_AVAILABLE, reason="Deterministic AEAD not available")
+def test_deterministic_bind_reuses_cached_ciphertext(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    field = DeterministicEncryptedString(keyset="deterministic", registry=registry)
+    first = field.process_bind_param("cached@example.com", None)
+
+    class _Unavailable:
+        def encrypt_deterministically(self, *_args: Any) -> bytes:
+            raise AssertionError("cache miss")
+
+    field._daead_primitive = _Unavailable()
+    assert field.process_bind_param("cached@example.com", None) == first
+
+    registry.set_config(dict(keysets))
+    assert field.process_bind_param("cached@example.com", None) == first
+
+    small = DeterministicEncryptedString(keyset="deterministic", registry=registry, bind_cache_size=2)
+    for value in ("a", "b", "c"):
+        small.process_bind_param(value, None)
+    assert len(small._bind_cache) == 2
+
+    uncached = DeterministicEncryptedString(keyset="deterministic", registry=registry, bind_cache_size=0)
+    assert uncached._bind_cache is None
+    assert uncached.process_bind_param("cached@example.com", None) == first
+
+    with pytest.raises(ConfigurationError):
+        DeterministicEncryptedString(keyset="deterministic", registry=registry, bind_cache_size=-1)
+
+
+@pytest.mark.skipif(not DAEAD_AVAILABLE, reason="Deterministic AEAD not available")
+def test_deterministic_precompute_values(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    field = DeterministicEncryptedString(
+        keyset="deterministic", registry=registry, precompute_values=("active", "suspended")
+    )
+    plain = DeterministicEncryptedString(keyset="deterministic", registry=registry)
+    ciphertext = field.process_bind_param("active", None)
+    assert ciphertext == plain.process_bind_param("active", None)
+    assert field._get_precomputed()[b"active"] == ciphertext
+    assert field.process_result_value(field.process_bind_param("other", None), None) == "other"
+
+    with pytest.raises(ConfigurationError):
+        DeterministicEncryptedString(
+            keyset="deterministic", registry=registry, aad_callback=lambda: b"x", precompute_values=("a",)
+        )
+
+
+def test_registry_config_is_a_snapshot(keysets: dict[str, dict[str, Any]]) -> None:
+    source = {name: dict(options) for name, options in keysets.items()}
+    registry = KeysetRegistry(source)
+    source["default"]["path"] = "/nonexistent.json"
+    assert registry.config["default"]["path"] == keysets["default"]["path"]
+
+
+def test_new_registry_reads_rotated_keyset_file(tmp_path: Path) -> None:
+    path = tmp_path / "aead_keyset.json"
+    shutil.copyfile(_fixture_path("aead_keyset.json"), path)
+    config = {"default": {"path": str(path), "cleartext": True}}
+    old_registry = KeysetRegistry(config)
+    ciphertext = old_registry.keyset_manager("default").aead_primitive.encrypt(b"value", b"")
+
+    rotated = tink.new_keyset_handle(aead.aead_key_templates.AES128_GCM)
+    with path.open("w") as keyset_file:
+        cleartext_keyset_handle.write(tink.JsonKeysetWriter(keyset_file), rotated)
+
+    assert old_registry.keyset_manager("default").aead_primitive.decrypt(ciphertext, b"") == b"value"
+    with pytest.raises(TinkError):
+        KeysetRegistry(config).keyset_manager("default").aead_primitive.decrypt(ciphertext, b"")
+
+
+def _constant_aad() -> str:
+    return "ctx"
+
+
+def test_registry_and_fields_can_be_pickled_and_deep_copied(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry({**keysets, "default": {**keysets["default"], "decrypt_cache": 8}})
+    fields: list[tuple[EncryptedType, Any]] = [
+        (EncryptedString(registry=registry, aad_callback=_constant_aad, aad_cache=True), "value"),
+        (EncryptedJSON(registry=registry), {"a": 1}),
+        (EncryptedBytes(registry=registry, fast_path=True), b"raw"),
+    ]
+    if DAEAD_AVAILABLE:
+        deterministic = DeterministicEncryptedString(
+            keyset="deterministic", registry=registry, precompute_values=("a",)
+        )
+        fields.append((deterministic, "a"))
+
+    assert pickle.loads(pickle.dumps(registry)).config == registry.config
+    for field, value in fields:
+        ciphertext = field.process_bind_param(value, None)
+        for clone in (copy.deepcopy(field), pickle.loads(pickle.dumps(field))):
+            assert clone.process_result_value(ciphertext, None) == value
+            assert clone.process_result_value(clone.process_bind_param(value, None), None) == value
+
+
+def test_stock_hooks_roundtrip_and_honour_subclass_overrides(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+
+    class AuditedString(EncryptedString):
+        def process_bind_param(self, value: Any, dialect: Any) -> Any:
+            return super().process_bind_param(value.strip(), dialect)
+
+    field = EncryptedString(registry=registry)
+    assert field.process_result_value(field.process_bind_param("value", None), None) == "value"
+    assert field.process_bind_param(None, None) is None
+
+    audited = AuditedString(registry=registry)
+    assert audited.process_result_value(audited.process_bind_param("  padded  ", None), None) == "padded"
+
+    contextual = EncryptedString(registry=registry, aad_callback=lambda: b"ctx")
+    assert contextual.process_result_value(contextual.process_bind_param("value", None), None) == "value"
+
+    if DAEAD_AVAILABLE:
+        deterministic = DeterministicEncryptedString(
+            keyset="deterministic", registry=registry, precompute_values=("active",)
+        )
+        for value in ("active", "other"):
+            ciphertext = deterministic.process_bind_param(value, None)
+            assert deterministic.process_result_value(memoryview(ciphertext), None) == value
+        assert "active".encode() in deterministic._precomputed
+        assert len(deterministic._bind_cache) == 1
+
+        blob = DeterministicEncryptedBytes(keyset="deterministic", registry=registry)
+        assert blob.process_result_value(blob.process_bind_param(bytearray(b"\x00raw"), None), None) == b"\x00raw"
+
+
+def test_keyset_manager_memoizes_primitives(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    manager = registry.keyset_manager("default")
+    primitive = manager.aead_primitive
+    assert manager.aead_primitive is primitive
+
+    registry.set_config(dict(keysets))
+    assert manager.aead_primitive is not primitive
+
+
+def test_fields_on_one_keyset_share_primitives(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    fields = [field_type(registry=registry) for field_type in (EncryptedString, EncryptedJSON, EncryptedBytes)]
+    assert len({id(field._get_aead()) for field in fields}) == 1
+
+    if AESGCM_AVAILABLE:
+        fast_string = EncryptedString(registry=registry, fast_path=True)
+        fast_bytes = EncryptedBytes(registry=registry, fast_path=True)
+        assert fast_string._get_aead() is fast_bytes._get_aead()
+
+
+@pytest.mark.skipif(not AESGCM_AVAILABLE, reason="cryptography is not installed")
+def test_ineligible_fast_path_keyset_is_inspected_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "xchacha_keyset.json"
+    with path.open("w") as keyset_file:
+        handle = tink.new_keyset_handle(aead.aead_key_templates.XCHACHA20_POLY1305)
+        cleartext_keyset_handle.write(tink.JsonKeysetWriter(keyset_file), handle)
+    calls = []
+    inspect = fields_module._aes_gcm_fast_path
+    monkeypatch.setattr(fields_module, "_aes_gcm_fast_path", lambda *args: calls.append(args) or inspect(*args))
+
+    registry = KeysetRegistry({"default": {"path": str(path), "cleartext": True}})
+    for _ in range(2):
+        assert registry.keyset_manager("default").fast_aead_primitive is None
+    assert len(calls) == 1
+
+
+def test_decrypt_cache_is_opt_in_per_keyset(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    field = EncryptedJSON(registry=registry)
+    ciphertext = field.process_bind_param({"a": 1}, None)
+    assert field.process_result_value(ciphertext, None) == {"a": 1}
+    assert registry._decrypt_caches == {}
+
+    registry.set_config({**keysets, "default": {**keysets["default"], "decrypt_cache": 8}})
+    first = field.process_result_value(ciphertext, None)
+    second = field.process_result_value(memoryview(ciphertext), None)
+    assert first == second == {"a": 1}
+    assert first is not second
+    assert len(registry._decrypt_caches["default"]) == 1
+
+    registry.set_config({**keysets, "default": {**keysets["default"], "decrypt_cache": -1}})
+    with pytest.raises(ConfigurationError):
+        field.process_result_value(ciphertext, None)
+
+
+def test_configured_fields_resolve_primitive_at_construction(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    assert EncryptedString(registry=registry)._aead_primitive is not None
+    assert EncryptedString(registry=KeysetRegistry({}))._aead_primitive is None
+    if DAEAD_AVAILABLE:
+        field = DeterministicEncryptedString(keyset="deterministic", registry=registry)
+        assert field._daead_primitive is not None
+        assert field._aead_primitive is None
+
+
+def test_construction_defers_keyset_errors_to_first_use(tmp_path: Path) -> None:
+    broken = {
+        "unknown_option": {"path": str(_fixture_path("aead_keyset.json")), "cleartext": True, "colour": "blue"},
+        "directory": {"path": str(tmp_path), "cleartext": True},
+        "unhashable": {"path": str(_fixture_path("aead_keyset.json")), "cleartext": True, "decrypt_cache": [1]},
+    }
+    registry = KeysetRegistry(broken)
+    for keyset, error in (("unknown_option", TypeError), ("directory", OSError), ("unhashable", TypeError)):
+        field = EncryptedString(registry=registry, keyset=keyset)
+        with pytest.raises(error):
+            field.process_bind_param("value", None)
+
+
+def test_encrypt_many_and_decrypt_many_roundtrip(keysets: dict[str, dict[str, Any]]) -> None:
+    registry = KeysetRegistry(keysets)
+    values = [{"a": 1}, None, ["x"]]
+    json_field = EncryptedJSON(registry=registry)
+    assert json_field.decrypt_many(json_field.encrypt_many(values)) == values
+
+    contextual = EncryptedString(registry=registry, aad_callback=lambda: "ctx")
+    ciphertexts = contextual.encrypt_many(["a", "b"])
+    assert contextual.decrypt_many([memoryview(ciphertext) for ciphertext in ciphertexts]) == ["a", "b"]
+
+    if DAEAD_AVAILABLE:
+        deterministic = DeterministicEncryptedString(keyset="deterministic", registry=registry)
+        ciphertexts = deterministic.encrypt_many(["a", "a", None])
+        assert ciphertexts[0] == ciphertexts[1]
+        assert deterministic.decrypt_many(ciphertexts) == ["a", "a", None]